@@ -129,8 +129,11 @@ def main() -> None:
     cu.header("ConsoleUtils — Full Feature Demo")
     cu.event("Starting demo run", level="INFO")
 
-    demo_messages(cu)
-    demo_structure(cu)
+    # render each section in one terminal write
+    with cu.bulk():
+        demo_messages(cu)
+    with cu.bulk():
+        demo_structure(cu)
     demo_data(cu)
     demo_secrets_and_kv(cu)
     demo_progress_and_status(cu)
@@ -0,0 +1,72 @@
+"""
+Pure-Python helpers with no Rich imports, kept separate so they can be
+compiled ahead of time with mypyc (see the optional hatch build hook in
+pyproject.toml). Behaviour is identical whether compiled or not.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, List, Optional, Set, Tuple
+
+def _mask(secret: str, keep: int, mask: str) -> str:
+    """Keep the first `keep` characters of `secret` and mask the remainder"""
+    if keep <= 0:
+        return mask * len(secret)
+    if len(secret) <= keep:
+        return secret
+    if len(mask) == 1:
+        # single C-level fill + allocation
+        return secret[:keep].ljust(len(secret), mask)
+    return secret[:keep] + mask * (len(secret) - keep)
+
+
+@lru_cache(maxsize=4096)
+def _bold(name: str) -> str:
+    # tree labels repeat heavily (dict keys, list indices), so cache the markup
+    return f"[bold]{name}[/bold]"
+
+
+def _walk_tree(obj: Any) -> List[Tuple[int, str]]:
+    """
+    Flatten nested data into pre-order (depth, label) pairs, where depth is the
+    depth of the parent node (0 = tree root) and label is the node's markup
+    """
+    out: List[Tuple[int, str]] = []
+    # Iterative depth-first walk; children are pushed in reverse so they pop
+    # (and are emitted) in their original order. `on_path` holds the ids of the
+    # containers being walked: an exit marker (exit_id set) is pushed beneath each
+    # container's children and removes its id once they are done, so
+    # self-references render as a <cycle> marker in O(1) per node.
+    on_path: Set[int] = set()
+    stack: List[Tuple[int, Any, Optional[str], Optional[int]]] = [(0, obj, None, None)]
+    while stack:
+        depth, item, key, exit_id = stack.pop()
+        if exit_id is not None:
+            on_path.discard(exit_id)
+            continue
+        if isinstance(item, (Mapping, list, tuple, set)):
+            item_id = id(item)
+            if item_id in on_path:
+                out.append((depth, f"{_bold(key)}: <cycle>" if key is not None else "<cycle>"))
+                continue
+            on_path.add(item_id)
+            stack.append((depth, None, None, item_id))
+        if isinstance(item, Mapping):
+            if key is not None:
+                out.append((depth, _bold(key)))
+                depth += 1
+            pairs: List[Tuple[Any, Any]] = list(item.items())
+            for i in range(len(pairs) - 1, -1, -1):
+                stack.append((depth, pairs[i][1], str(pairs[i][0]), None))
+        elif isinstance(item, (list, tuple, set)):
+            out.append(
+                (depth, _bold(key) if key is not None else f"{_bold(type(item).__name__)} ({len(item)})")
+            )
+            children: List[Any] = list(item)
+            for i in range(len(children) - 1, -1, -1):
+                stack.append((depth + 1, children[i], str(i), None))
+        else:
+            out.append((depth, f"{_bold(key)}: {item}" if key is not None else str(item)))
+    return out
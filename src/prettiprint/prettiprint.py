@@ -1,28 +1,31 @@
 from __future__ import annotations
 
+import inspect
+import json
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Mapping, Optional, Sequence, Union
-
-from rich.console import Console
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, FrozenSet, Iterator, Mapping, Optional, Sequence, Tuple, Union
+
+from rich.console import COLOR_SYSTEMS, Console, Group
+from rich.markup import escape
+from rich.rule import Rule
+from rich.text import Text
 from rich.theme import Theme
 from rich.table import Table
 from rich.panel import Panel
-from rich.json import JSON
-from rich.progress import (
-    Progress,
-    SpinnerColumn,
-    BarColumn,
-    TextColumn,
-    TimeElapsedColumn,
-    TimeRemainingColumn,
-)
-from rich.traceback import install as install_rich_traceback
-from rich.markdown import Markdown
-from rich.tree import Tree
-from rich.syntax import Syntax
 from rich import box
 
+from ._core import _mask, _walk_tree
+
+# Heavier rich submodules (pygments-backed syntax, markdown, progress, ...) are
+# imported inside the methods that use them to keep import time low.
+if TYPE_CHECKING:
+    from rich.progress import Progress
+    from rich.tree import Tree
+
 # ---------- Theme Presets ----------
 _PRESET_THEMES = {
     "dark": {
@@ -82,6 +85,49 @@ _PRESET_THEMES = {
 }
 
 
+# spacer() size keywords -> number of lines
+_SIZE_MAP = {"small": 1, "s": 1, "medium": 2, "m": 2, "large": 3, "l": 3}
+
+# Common box names + synonyms accepted by panel(box=...)
+_BOX_MAP = {
+    "ROUNDED": box.ROUNDED,
+    "ROUND": box.ROUNDED,
+    "SQUARE": box.SQUARE,
+    "HEAVY": box.HEAVY,
+    "THICK": box.HEAVY,
+    "DOUBLE": box.DOUBLE,
+    "ASCII": box.ASCII,
+    "MINIMAL": box.MINIMAL,
+    "MINIMAL_HEAVY": box.MINIMAL_HEAVY_HEAD,
+    "MINIMAL_DOUBLE": box.MINIMAL_DOUBLE_HEAD,
+    "SIMPLE": box.SIMPLE,
+    "SIMPLE_HEAVY": box.SIMPLE_HEAVY,
+    "SIMPLE_HEAD": box.SIMPLE_HEAD,
+}
+
+
+@lru_cache(maxsize=64)
+def _normalize_box_key(s: str) -> str:
+    # case-insensitive, allow spaces and hyphens
+    return s.strip().upper().replace("-", "_").replace(" ", "_")
+
+
+@lru_cache(maxsize=16)
+def _build_theme(theme: str, extra: FrozenSet[Tuple[str, str]]) -> Tuple[Theme, Mapping[str, str]]:
+    """
+    Merge a preset theme with custom styles and compile it into a rich Theme.
+    Cached so switching back and forth between themes does not re-parse styles;
+    the merged styles are returned read-only since every caller shares them.
+    """
+    name = theme.lower()
+    if name not in _PRESET_THEMES:
+        raise ValueError(
+            f"Unknown theme '{theme}'. Choose from: {', '.join(_PRESET_THEMES)}"
+        )
+    merged = {**_PRESET_THEMES[name], **dict(extra)}
+    return Theme(merged), MappingProxyType(merged)
+
+
 @dataclass
 class ConsoleConfig:
     theme: str = "dark"
@@ -91,6 +137,77 @@ class ConsoleConfig:
     enable_tracebacks: bool = True
 
 
+# Container types dictionary() labels with their type name
+_COMPOUND_TYPES = (dict, list, tuple, set)
+_COMPOUND = frozenset(_COMPOUND_TYPES)
+_SCALAR = frozenset((str, int, float, bool, type(None)))
+
+# rich.traceback replaces sys.excepthook process-wide, so install it only once
+_TRACEBACK_INSTALLED = False
+
+# Max highlighted payloads kept by ConsoleUtils.json() (FIFO eviction)
+_JSON_CACHE_SIZE = 32
+
+
+def _make_noop(method: Any) -> Any:
+    """
+    Build a do-nothing stand-in for an unbound method that accepts exactly the
+    same arguments (minus self), so misuse still raises TypeError while silent
+    and help() still shows the real signature
+    """
+    sig = inspect.signature(method)
+    params = list(sig.parameters.values())[1:]
+    namespace: dict = {}
+    parts = []
+    star_added = False
+    for i, p in enumerate(params):
+        if p.kind is p.KEYWORD_ONLY and not star_added:
+            parts.append("*")
+            star_added = True
+        if p.default is not p.empty:
+            namespace[f"_d{i}"] = p.default
+            parts.append(f"{p.name}=_d{i}")
+        else:
+            parts.append(p.name)
+    exec(f"def {method.__name__}({', '.join(parts)}):\n    return None", namespace)  # pylint: disable=exec-used
+    noop = namespace[method.__name__]
+    noop.__doc__ = method.__doc__
+    noop.__qualname__ = method.__qualname__
+    noop.__signature__ = sig.replace(parameters=params)
+    return noop
+
+
+# Output methods rebound to a no-op on the instance while verbosity is 0
+_SILENCEABLE = (
+    "header", "rule", "panel", "markdown", "code",
+    "success", "info", "warning", "error", "event",
+    "fast_success", "fast_info", "fast_warning", "fast_error",
+    "write", "writeln",
+    "table", "dictionary", "json", "tree", "key_value",
+)
+
+
+class _Batch:
+    """
+    Context manager returned by ConsoleUtils.batch(); buffers message output
+    and prints it with a single Console.print call on exit
+    """
+
+    def __init__(self, utils: "ConsoleUtils") -> None:
+        self._utils = utils
+        self._outer = False
+
+    def __enter__(self) -> "ConsoleUtils":
+        self._outer = not self._utils._batching
+        self._utils._batching = True
+        return self._utils
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._outer:
+            self._utils._batching = False
+            self._utils.flush()
+
+
 class ConsoleUtils:
     """
     Instantiable Rich console helper with theming, styling, and verbosity
@@ -106,18 +223,20 @@ class ConsoleUtils:
         enable_tracebacks: bool = True,
         custom_styles: Optional[dict] = None,
     ) -> None:
-        if enable_tracebacks:
+        global _TRACEBACK_INSTALLED
+        if enable_tracebacks and not _TRACEBACK_INSTALLED:
+            from rich.traceback import install as install_rich_traceback
+
             install_rich_traceback(show_locals=False)
+            _TRACEBACK_INSTALLED = True
 
         theme_name = theme.lower()
-        if theme_name not in _PRESET_THEMES:
-            raise ValueError(
-                f"Unknown theme '{theme}'. Choose from: {', '.join(_PRESET_THEMES)}"
-            )
-        merged = {**_PRESET_THEMES[theme_name], **(custom_styles or {})}
+        extra = frozenset((custom_styles or {}).items())
+        compiled, merged = _build_theme(theme, extra)
 
-        self._console = Console(theme=Theme(merged), emoji=emoji, soft_wrap=False)
-        self._styles = merged
+        self._console = Console(theme=compiled, emoji=emoji, soft_wrap=False)
+        self._theme_pushed = False
+        self._apply_styles(merged)
         self._config = ConsoleConfig(
             theme=theme_name,
             emoji=emoji,
@@ -125,6 +244,12 @@ class ConsoleUtils:
             verbosity=verbosity,
             enable_tracebacks=enable_tracebacks,
         )
+        self._line_buffer: list[str] = []
+        self._line_open = False
+        self._batching = False
+        self._ts_cache = (0, "")
+        self._json_cache: dict[str, Any] = {}
+        self._bind_verbosity()
 
     # ---------- Static-ish helpers ----------
     @staticmethod
@@ -135,11 +260,7 @@ class ConsoleUtils:
         """
         if not isinstance(secret, str):
             secret = str(secret)
-        if keep <= 0:
-            return mask * len(secret)
-        if len(secret) <= keep:
-            return secret
-        return secret[:keep] + (mask * (len(secret) - keep))
+        return _mask(secret, keep, mask)
 
     # ---------- Config ----------
     @property
@@ -148,28 +269,30 @@ class ConsoleUtils:
 
     def set_theme(self, theme: str, custom_styles: Optional[dict] = None) -> None:
         name = theme.lower()
-        if name not in _PRESET_THEMES:
-            raise ValueError(
-                f"Unknown theme '{theme}'. Choose from: {', '.join(_PRESET_THEMES)}"
-            )
-        merged = {**_PRESET_THEMES[name], **(custom_styles or {})}
-        self._styles = merged
-        self._console = Console(
-            theme=Theme(merged), emoji=self._config.emoji, soft_wrap=False
-        )
+        extra = frozenset((custom_styles or {}).items())
+        compiled, merged = _build_theme(theme, extra)
+
+        # Swap the style registry in place rather than building a new Console, which
+        # would re-probe the terminal; only one pushed theme is kept on the stack
+        if self._theme_pushed:
+            self._console.pop_theme()
+        self._console.push_theme(compiled, inherit=False)
+        self._theme_pushed = True
+        self._apply_styles(merged)
         self._config.theme = name
 
     def set_verbosity(self, level: int) -> None:
+        """Set verbosity (0..3); at 0 the output methods are replaced by no-ops"""
         self._config.verbosity = max(0, min(3, level))
+        self._bind_verbosity()
 
     # ---------- Structure ----------
     def header(self, msg: str, *, style: Optional[str] = None) -> None:
         if self._config.verbosity == 0:
             return
         style = style or "bold cyan"
-        self.spacer()
-        self._console.rule(f"[{style}]{msg}[/]")
-        self.spacer()
+        # blank line, rule, blank line rendered as one renderable
+        self._print(Group(Text(""), Rule(f"[{style}]{msg}[/]"), Text("")))
 
     def rule(self, label: str = "", *, label_style: Optional[str] = None, line_style: Optional[str] = None ) -> None:
         if self._config.verbosity == 0:
@@ -179,6 +302,7 @@ class ConsoleUtils:
         label_style = label_style or "#cccccc"
         line_style = line_style or self._styles.get("rule", "dim")
 
+        self.flush()
         # If label present, apply styling
         if label:
             styled_label = f"[{label_style}]{label}[/{label_style}]"
@@ -192,16 +316,13 @@ class ConsoleUtils:
         Args:
             size (int or str, optional): Number of lines to add, integer or keywords i.e., small=1, medium=2, large=3. Defaults to 1.
         """
-        if size in ("small", "s"):
-            lines = 1
-        elif size in ("medium", "m"):
-            lines = 2
-        elif size in ("large", "l"):
-            lines = 3
-        else:
+        lines = _SIZE_MAP.get(size)
+        if lines is None:
             lines = int(size)
-        for _ in range(lines):
-            self._console.print("")
+        if lines <= 0:
+            return
+        # one print; the trailing end="\n" supplies the last line
+        self._print("\n" * (lines - 1))
         
     def panel(
         self,
@@ -249,12 +370,14 @@ class ConsoleUtils:
         if padding is not None:
             panel_kwargs["padding"] = padding
         
-        self._console.print(Panel(message, **panel_kwargs))
+        self._print(Panel(message, **panel_kwargs))
 
     def markdown(self, text: str) -> None:
         if self._config.verbosity == 0:
             return
-        self._console.print(Markdown(text))
+        from rich.markdown import Markdown
+
+        self._print(Markdown(text))
 
     def code(
         self, code: str, language: str = "python", title: Optional[str] = None, wrap: bool = False,
@@ -272,8 +395,10 @@ class ConsoleUtils:
         """
         if self._config.verbosity == 0:
             return
+        from rich.syntax import Syntax
+
         syn = Syntax(code, language, line_numbers=True, word_wrap=wrap)
-        self._console.print(
+        self._print(
             Panel(syn, title=title, border_style=self._styles["code.border"], padding=(1,0))
         )
 
@@ -281,30 +406,48 @@ class ConsoleUtils:
     def success(self, message: str) -> None:
         if self._config.verbosity == 0:
             return
-        self._console.print(
-            f"✅ [{self._styles['success']}]{message}[/{self._styles['success']}]"
-        )
+        self._emit(f"✅ {self._t_success[0]}{message}{self._t_success[1]}")
 
     def info(self, message: str) -> None:
         if self._config.verbosity == 0:
             return
-        self._console.print(
-            f"ℹ️ [{self._styles['info']}]{message}[/{self._styles['info']}]"
-        )
+        self._emit(f"ℹ️ {self._t_info[0]}{message}{self._t_info[1]}")
 
     def warning(self, message: str) -> None:
         if self._config.verbosity == 0:
             return
-        self._console.print(
-            f"⚠️ [{self._styles['warning']}]{message}[/{self._styles['warning']}]"
-        )
+        self._emit(f"⚠️ {self._t_warning[0]}{message}{self._t_warning[1]}")
 
     def error(self, message: str) -> None:
         if self._config.verbosity == 0:
             return
-        self._console.print(
-            f"❌ [{self._styles['error']}]{message}[/{self._styles['error']}]"
-        )
+        self._emit(f"❌ {self._t_error[0]}{message}{self._t_error[1]}")
+
+    # ---------- Fast messages ----------
+    # Same look as success/info/warning/error, but the text is written straight to
+    # the console's file with pre-rendered ANSI codes: no markup parsing, and
+    # `message` is printed literally. Inside batch(), bulk(), console.capture() or
+    # on a recording console they fall back to the normal (escaped) render path so
+    # ordering, capture and recording still work.
+    def fast_success(self, message: str) -> None:
+        if self._config.verbosity == 0:
+            return
+        self._fast_write("✅", self._ansi_success, self._t_success, message)
+
+    def fast_info(self, message: str) -> None:
+        if self._config.verbosity == 0:
+            return
+        self._fast_write("ℹ️", self._ansi_info, self._t_info, message)
+
+    def fast_warning(self, message: str) -> None:
+        if self._config.verbosity == 0:
+            return
+        self._fast_write("⚠️", self._ansi_warning, self._t_warning, message)
+
+    def fast_error(self, message: str) -> None:
+        if self._config.verbosity == 0:
+            return
+        self._fast_write("❌", self._ansi_error, self._t_error, message)
 
     def event(self, message: str, level: str = "INFO") -> None:
         if self._config.verbosity == 0:
@@ -318,16 +461,76 @@ class ConsoleUtils:
         # hide all DEBUG events at verbosity 2
         if self._config.verbosity < 3 and lvl == "DEBUG":
             return
-        ts = (
-            datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            if self._config.timestamps
-            else ""
+        ts = self._timestamp() if self._config.timestamps else ""
+        padded, color = self._event_prefix_cache.get(lvl) or (
+            f"{lvl:<7} ",
+            self._styles.get(f"event.{lvl}", self._styles["info"]),
         )
-        color = self._styles.get(f"event.{lvl}", self._styles["info"])
-        prefix = f"[{ts}] {lvl:<7} " if ts else f"{lvl:<7} "
-        self._console.print(f"[{color}]{prefix}[/]{message}")
+        self._emit(f"[{color}][{ts}] {padded}[/]{message}" if ts else f"[{color}]{padded}[/]{message}")
+
+    # ---------- Buffered output ----------
+    def batch(self) -> _Batch:
+        """Collect message output and print it with a single Console.print call on exit
+
+        Messages (success/info/warning/error/event and write/writeln) are buffered;
+        any other output flushes the buffer first, so ordering is preserved.
+
+        Example:
+            with cu.batch():
+                for name in names:
+                    cu.info(f"Processed {name}")
+        """
+        return _Batch(self)
+
+    def write(self, text: str) -> None:
+        """Append pre-formatted Rich markup to the current buffered line
+
+        Buffered text is printed by flush(), at the end of a batch() block, or
+        before the next direct output; call flush() yourself if nothing follows.
+        """
+        if self._config.verbosity == 0:
+            return
+        if self._line_open:
+            self._line_buffer[-1] += text
+        else:
+            self._line_buffer.append(text)
+            self._line_open = True
+
+    def writeln(self, text: str = "") -> None:
+        """Append pre-formatted Rich markup to the buffer and end the line (see write())"""
+        if self._config.verbosity == 0:
+            return
+        self.write(text)
+        self._line_open = False
+
+    def flush(self) -> None:
+        """Print everything buffered by write/writeln or batch() in one Console.print call"""
+        if self._line_buffer:
+            # separate objects so each line's markup is parsed on its own
+            self._console.print(*self._line_buffer, sep="\n")
+            self._line_buffer.clear()
+        self._line_open = False
+
+    @contextmanager
+    def bulk(self) -> Iterator["ConsoleUtils"]:
+        """Buffer everything rendered inside the block and write it to the terminal at once
+
+        Unlike batch(), this covers panels, tables, code etc. as well as messages,
+        replacing one terminal write per element with a single write on exit.
+        Don't use it around status() or progress(), which need live output.
+
+        Example:
+            with cu.bulk():
+                cu.header("Report")
+                cu.table(headers, rows)
+        """
+        # Entering the Console holds its render buffer until exit, then writes it
+        # through Rich's own write path (legacy Windows, chunked writes, record)
+        with self._console:
+            yield self
 
     def print_exception(self) -> None:
+        self.flush()
         self._console.print_exception()
 
     # ---------- Data ----------
@@ -351,9 +554,17 @@ class ConsoleUtils:
         )
         for h in headers:
             t.add_column(str(h))
+        add_row = t.add_row
         for row in rows:
-            t.add_row(*[str(c) for c in row])
-        self._console.print(t)
+            if type(row) not in (list, tuple):
+                # materialize iterators/generators so the type check doesn't consume them
+                row = tuple(row)
+            # rows made only of plain str need no conversion
+            if any(type(c) is not str for c in row):
+                add_row(*map(str, row))
+            else:
+                add_row(*row)
+        self._print(t)
 
     def dictionary(
         self, data: Mapping[Any, Any], *, title: Optional[str] = None, expand: bool = True
@@ -373,25 +584,34 @@ class ConsoleUtils:
         grid = Table.grid(padding=(0, 1))
         grid.add_column("Key", style=self._styles["key"], justify="right")
         grid.add_column("Value", style=self._styles["value"])
-        for k, v in data.items():
-            grid.add_row(str(k), self._repr_value(v))
-        self._console.print(
+        # keys/values extracted in bulk; containers are classified by exact type
+        # first, with isinstance only for unknown types (e.g. OrderedDict)
+        add_row = grid.add_row
+        for k, v in zip(list(data.keys()), list(data.values())):
+            t = type(v)
+            if t in _COMPOUND or (t not in _SCALAR and isinstance(v, _COMPOUND_TYPES)):
+                add_row(str(k), f"[dim]{t.__name__}[/dim] {v}")
+            else:
+                add_row(str(k), str(v))
+        self._print(
             Panel(grid, title=title, border_style=self._styles["panel"], expand=expand)
         )
 
     def json(self, data: Any, *, title: Optional[str] = None) -> None:
         if self._config.verbosity == 0:
             return
-        self._console.print(
-            Panel(JSON.from_data(data), title=title, border_style=self._styles["panel"])
+        self._print(
+            Panel(self._json_renderable(data), title=title, border_style=self._styles["panel"])
         )
 
     def tree(self, obj: Any, *, title: str = "Structure") -> None:
         if self._config.verbosity == 0:
             return
-        root = Tree(f"[{self._styles['info']}]{title}[/{self._styles['info']}]")
+        from rich.tree import Tree
+
+        root = Tree(f"{self._t_info[0]}{title}{self._t_info[1]}")
         self._add_to_tree(root, obj)
-        self._console.print(root)
+        self._print(root)
 
     def key_value(
         self,
@@ -409,12 +629,13 @@ class ConsoleUtils:
         if self._config.verbosity == 0:
             return
         display = self.mask_secret(value, keep=keep, mask=mask) if secret else value
-        self._console.print(
-            f"[{self._styles['key']}]{key}[/]: [{self._styles['value']}]{display}[/]"
+        self._print(
+            f"{self._t_key[0]}{key}{self._t_key[1]}: {self._t_value[0]}{display}{self._t_value[1]}"
         )
 
     # ---------- Progress / Spinners ----------
     def status(self, text: str):
+        self.flush()
         return self._console.status(text)
 
     def progress(
@@ -423,6 +644,15 @@ class ConsoleUtils:
         show_speed: bool = True,
         description: str = "",
     ) -> Progress:
+        from rich.progress import (
+            Progress,
+            SpinnerColumn,
+            BarColumn,
+            TextColumn,
+            TimeElapsedColumn,
+            TimeRemainingColumn,
+        )
+
         cols = [
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -433,15 +663,18 @@ class ConsoleUtils:
             cols += [TimeElapsedColumn(), TimeRemainingColumn()]
         if description:
             cols[1] = TextColumn(f"[progress.description]{description}")
+        self.flush()
         return Progress(*cols, transient=transient, console=self._console)
 
     # ---------- Prompts ----------
     def prompt(self, message: str, *, password: bool = False) -> str:
         suffix = " (hidden)" if password else ""
+        self.flush()
         return self._console.input(f"[{self._styles['accent']}]{message}{suffix}[/] ")
 
     def confirm(self, message: str, default: bool = True) -> bool:
         hint = "Y/n" if default else "y/N"
+        self.flush()
         resp = (
             self._console.input(f"[{self._styles['accent']}]{message} [{hint}][/] ")
             .strip()
@@ -452,27 +685,102 @@ class ConsoleUtils:
         return resp in {"y", "yes", "true", "1"}
 
     # ---------- Internals ----------
-    def _repr_value(self, v: Any) -> str:
-        if isinstance(v, (dict, list, tuple, set)):
-            return f"[dim]{type(v).__name__}[/dim] {v}"
-        return str(v)
+    def _apply_styles(self, merged: Mapping[str, str]) -> None:
+        """Store the active styles and precompute markup tags and per-level event prefixes"""
+        self._styles = merged
+        self._t_success = self._tags(merged["success"])
+        self._t_info = self._tags(merged["info"])
+        self._t_warning = self._tags(merged["warning"])
+        self._t_error = self._tags(merged["error"])
+        self._t_key = self._tags(merged["key"])
+        self._t_value = self._tags(merged["value"])
+        self._ansi_success = self._ansi(merged["success"])
+        self._ansi_info = self._ansi(merged["info"])
+        self._ansi_warning = self._ansi(merged["warning"])
+        self._ansi_error = self._ansi(merged["error"])
+        # built-in levels plus any custom "event.<LEVEL>" styles
+        levels = {"INFO", "SUCCESS", "WARNING", "ERROR", "DEBUG"}
+        levels.update(k[len("event."):] for k in merged if k.startswith("event."))
+        self._event_prefix_cache = {
+            lvl: (f"{lvl:<7} ", merged.get(f"event.{lvl}", merged["info"])) for lvl in levels
+        }
 
-    # ---------- Helpers ----------
-    def _add_to_tree(self, node: Tree, obj: Any, name: Optional[str] = None) -> None:
-        label = f"[bold]{name}[/bold]" if name is not None else ""
-        if isinstance(obj, Mapping):
-            branch = node if not label else node.add(label)
-            for k, v in obj.items():
-                self._add_to_tree(branch, v, name=str(k))
-        elif isinstance(obj, (list, tuple, set)):
-            branch = node.add(
-                label or f"[bold]{type(obj).__name__}[/bold] ({len(obj)})"
-            )
-            for idx, item in enumerate(obj):
-                self._add_to_tree(branch, item, name=str(idx))
+    def _fast_write(
+        self, emoji: str, ansi: Tuple[str, str], tags: Tuple[str, str], message: str
+    ) -> None:
+        console = self._console
+        # a console buffer is active inside bulk()/capture(); writing to the file
+        # directly would skip it
+        if self._batching or console.record or console._buffer_index:  # pylint: disable=protected-access
+            self._emit(f"{emoji} {tags[0]}{escape(message)}{tags[1]}")
+            return
+        self.flush()
+        console.file.write(f"{emoji} {ansi[0]}{message}{ansi[1]}\n")
+
+    def _print(self, *objects: Any, **kwargs: Any) -> None:
+        # anything printed directly goes after the messages buffered before it
+        self.flush()
+        self._console.print(*objects, **kwargs)
+
+    def _bind_verbosity(self) -> None:
+        # When silent, shadow the output methods with a no-op so callers skip the
+        # method body entirely; otherwise drop the shadows to expose the real methods
+        if self._config.verbosity == 0:
+            for name in _SILENCEABLE:
+                setattr(self, name, _NOOPS[name])
         else:
-            node.add(f"{label}: {obj}" if label else str(obj))
-    
+            for name in _SILENCEABLE:
+                self.__dict__.pop(name, None)
+
+    def _emit(self, line: str) -> None:
+        if self._batching:
+            self._line_buffer.append(line)
+            self._line_open = False
+        else:
+            self._print(line)
+
+    @staticmethod
+    def _tags(style: str) -> Tuple[str, str]:
+        return f"[{style}]", f"[/{style}]"
+
+    def _ansi(self, style: str) -> Tuple[str, str]:
+        """ANSI (open, close) codes for `style` on this console; empty when it has no color"""
+        console = self._console
+        if console.color_system is None or console.no_color or console.legacy_windows:
+            return "", ""
+        rendered = console.get_style(style).render("\x00", color_system=COLOR_SYSTEMS[console.color_system])
+        prefix, _, suffix = rendered.partition("\x00")
+        return prefix, suffix
+
+    def _json_renderable(self, data: Any) -> Any:
+        # Keyed on the serialized text rather than id(data) so mutated or recycled
+        # objects never hit a stale entry; a hit skips the syntax highlighting pass
+        from rich.json import JSON
+
+        key = json.dumps(data, indent=2, ensure_ascii=False)
+        rendered = self._json_cache.get(key)
+        if rendered is None:
+            rendered = JSON.from_data(data)
+            if len(self._json_cache) >= _JSON_CACHE_SIZE:
+                del self._json_cache[next(iter(self._json_cache))]
+            self._json_cache[key] = rendered
+        return rendered
+
+    def _timestamp(self) -> str:
+        # Events within the same wall-clock second share one formatted string
+        sec = int(time.time())
+        if sec != self._ts_cache[0]:
+            self._ts_cache = (sec, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec)))
+        return self._ts_cache[1]
+
+    # ---------- Helpers ----------
+    def _add_to_tree(self, node: Tree, obj: Any) -> None:
+        # nodes[d] is the most recent node at depth d; each label attaches to its parent's slot
+        nodes = [node]
+        for depth, label in _walk_tree(obj):
+            del nodes[depth + 1:]
+            nodes.append(nodes[depth].add(label))
+
     def _resolve_box(self, box_like: Union[str, "box.Box", None]) -> "box.Box":
         """
         Accepts a rich.box.Box or a string like 'double', 'heavy', 'rounded', etc.
@@ -483,24 +791,8 @@ class ConsoleUtils:
         if isinstance(box_like, box.Box):
             return box_like
 
-        # Normalize string: case-insensitive, allow spaces and hyphens
-        key = str(box_like).strip().upper().replace("-", "_").replace(" ", "_")
-
-        # Common names + synonyms
-        mapping = {
-        "ROUNDED": box.ROUNDED,
-        "ROUND": box.ROUNDED,
-        "SQUARE": box.SQUARE,
-        "HEAVY": box.HEAVY,
-        "THICK": box.HEAVY,
-        "DOUBLE": box.DOUBLE,
-        "ASCII": box.ASCII,
-        "MINIMAL": box.MINIMAL,
-        "MINIMAL_HEAVY": box.MINIMAL_HEAVY_HEAD,
-        "MINIMAL_DOUBLE": box.MINIMAL_DOUBLE_HEAD,
-        "SIMPLE": box.SIMPLE,
-        "SIMPLE_HEAVY": box.SIMPLE_HEAVY,
-        "SIMPLE_HEAD": box.SIMPLE_HEAD,
-        }
+        return _BOX_MAP.get(_normalize_box_key(str(box_like)), box.ROUNDED)
+
 
-        return mapping.get(key, box.ROUNDED)
\ No newline at end of file
+# Signature-preserving no-ops used by ConsoleUtils._bind_verbosity
+_NOOPS = {name: _make_noop(getattr(ConsoleUtils, name)) for name in _SILENCEABLE}